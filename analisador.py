@@ -0,0 +1,259 @@
+import gzip
+import sys
+from collections import Counter, deque
+from itertools import islice
+from multiprocessing import Pool, cpu_count
+
+from jogo import Damas, Jogador
+
+# Formato compacto do arquivo de partidas:
+#   - uma partida por linha, lances separados por espaço
+#   - cada lance é a sequência de casas visitadas, dois dígitos por casa
+#     (linha e coluna), ex.: "5243" = (5,2) -> (4,3); "52341605" = captura múltipla
+#   - linhas vazias ou iniciadas por '#' são ignoradas
+# Arquivos terminados em ".gz" são lidos descompactando em fluxo.
+
+LANCES_ABERTURA = 4
+TAMANHO_LOTE = 512
+
+
+def ler_registros(caminho):
+    """Gera as linhas de partidas do arquivo sob demanda, sem carregá-lo inteiro"""
+    abrir = gzip.open if caminho.endswith(".gz") else open
+    with abrir(caminho, "rt", encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            linha = linha.strip()
+            if linha and not linha.startswith("#"):
+                yield linha
+
+
+def converter_lance(lance):
+    """
+    Converte um lance compacto ("5243") para a lista de posições aceita por validar_e_mover
+    Retorna: lista de tuplas ou None se o lance estiver mal formatado
+    """
+    if len(lance) < 4 or len(lance) % 2 or not lance.isdigit():
+        return None
+    return [(int(lance[i]), int(lance[i + 1])) for i in range(0, len(lance), 2)]
+
+
+def formatar_lance(posicoes):
+    """Converte uma lista de posições para o formato compacto do arquivo"""
+    return "".join(f"{l}{c}" for l, c in posicoes)
+
+
+def reproduzir_partida(lances):
+    """
+    Reproduz uma partida no motor de regras
+    lances: lista de lances no formato compacto
+    Retorna: (resultado, capturas_por_lance, erro)
+      resultado: 'b', 'p', "EMPATE" ou None (partida não terminada)
+      capturas_por_lance: lista com o número de peças capturadas em cada lance
+      erro: mensagem de erro ou None se o registro é válido
+    """
+    jogador_branco = Jogador('b', "Brancas")
+    jogador_preto = Jogador('p', "Pretas")
+    jogo = Damas(jogador_branco, jogador_preto)
+    capturas = []
+    resultado = None
+
+    for idx, lance in enumerate(lances):
+        if resultado is not None:
+            return resultado, capturas, f"Lance {idx + 1} ({lance}) após o fim da partida."
+        posicoes = converter_lance(lance)
+        if posicoes is None:
+            return None, capturas, f"Lance {idx + 1} ({lance}) mal formatado."
+
+        adversario = jogador_preto if jogo.jogador_atual is jogador_branco else jogador_branco
+        pecas_antes = adversario.quantidade_pecas()
+        erro = jogo.validar_e_mover(posicoes)
+        if erro:
+            return None, capturas, f"Lance {idx + 1} ({lance}): {erro}"
+        capturas.append(pecas_antes - adversario.quantidade_pecas())
+
+        vencedor = jogo.verificar_vitoria()
+        if vencedor == "EMPATE":
+            resultado = "EMPATE"
+        elif vencedor:
+            resultado = vencedor.cor
+        else:
+            jogo.trocar_turno()
+
+    return resultado, capturas, None
+
+
+class Estatisticas:
+    """Agrega os resultados da análise em memória constante (apenas contadores)"""
+
+    MAX_EXEMPLOS_ILEGAIS = 10
+
+    def __init__(self, lances_abertura=LANCES_ABERTURA):
+        """lances_abertura: quantidade de lances iniciais que identificam uma abertura"""
+        self.lances_abertura = lances_abertura
+        self.partidas = 0
+        self.ilegais = 0
+        self.exemplos_ilegais = []
+        self.aberturas = Counter()
+        self.duracoes = Counter()
+        self.resultados = Counter()
+        self.capturas_por_partida = Counter()
+        self.capturas_por_cor = Counter()
+        self.capturas_multiplas = 0
+        self.resultados_por_primeiro_lance = {}
+
+    def registrar(self, linha):
+        """Reproduz uma linha do arquivo e acumula suas estatísticas"""
+        self.partidas += 1
+        lances = linha.split()
+        resultado, capturas, erro = reproduzir_partida(lances)
+
+        if erro:
+            self.ilegais += 1
+            if len(self.exemplos_ilegais) < self.MAX_EXEMPLOS_ILEGAIS:
+                self.exemplos_ilegais.append((linha[:60], erro))
+            return
+
+        self.aberturas[" ".join(lances[:self.lances_abertura])] += 1
+        self.duracoes[len(lances)] += 1
+        self.resultados[resultado or "*"] += 1
+        self.capturas_por_partida[sum(capturas)] += 1
+        for idx, qtd in enumerate(capturas):
+            # Brancas jogam os lances de índice par
+            self.capturas_por_cor["b" if idx % 2 == 0 else "p"] += qtd
+            if qtd > 1:
+                self.capturas_multiplas += 1
+        if lances:
+            self.resultados_por_primeiro_lance.setdefault(lances[0], Counter())[resultado or "*"] += 1
+
+    def mesclar(self, outra):
+        """Acumula as estatísticas de outra instância (ex.: de um lote processado em paralelo)"""
+        self.partidas += outra.partidas
+        self.ilegais += outra.ilegais
+        faltam = self.MAX_EXEMPLOS_ILEGAIS - len(self.exemplos_ilegais)
+        self.exemplos_ilegais.extend(outra.exemplos_ilegais[:max(faltam, 0)])
+        self.aberturas.update(outra.aberturas)
+        self.duracoes.update(outra.duracoes)
+        self.resultados.update(outra.resultados)
+        self.capturas_por_partida.update(outra.capturas_por_partida)
+        self.capturas_por_cor.update(outra.capturas_por_cor)
+        self.capturas_multiplas += outra.capturas_multiplas
+        for lance, contagem in outra.resultados_por_primeiro_lance.items():
+            self.resultados_por_primeiro_lance.setdefault(lance, Counter()).update(contagem)
+        return self
+
+    def taxas_por_primeiro_lance(self):
+        """
+        Calcula as taxas de vitória agrupadas pelo primeiro lance
+        Retorna: dict {lance: (partidas, vitórias brancas, vitórias pretas, empates)} em frações
+        """
+        taxas = {}
+        for lance, contagem in self.resultados_por_primeiro_lance.items():
+            total = sum(contagem.values())
+            taxas[lance] = (total, contagem["b"] / total, contagem["p"] / total, contagem["EMPATE"] / total)
+        return taxas
+
+    def relatorio(self, limite=10):
+        """Retorna um resumo textual das estatísticas"""
+        validas = self.partidas - self.ilegais
+        texto = "=" * 65 + "\n"
+        texto += "                    ANÁLISE DO ARQUIVO DE PARTIDAS\n"
+        texto += "=" * 65 + "\n\n"
+        texto += f"  Partidas lidas: {self.partidas}\n"
+        texto += f"  Registros ilegais: {self.ilegais}\n"
+        texto += f"  Partidas válidas: {validas}\n\n"
+
+        if validas:
+            texto += "  RESULTADOS:\n"
+            for resultado, nome in (("b", "Brancas"), ("p", "Pretas"), ("EMPATE", "Empates"), ("*", "Não terminadas")):
+                texto += f"    {nome:<16} {self.resultados[resultado]:>8} ({self.resultados[resultado] / validas:.1%})\n"
+
+            total_lances = sum(d * n for d, n in self.duracoes.items())
+            texto += "\n  DURAÇÃO (lances):\n"
+            texto += f"    mínima {min(self.duracoes)}, máxima {max(self.duracoes)}, média {total_lances / validas:.1f}\n"
+            for faixa in range(0, max(self.duracoes) + 1, 10):
+                qtd = sum(n for d, n in self.duracoes.items() if faixa <= d < faixa + 10)
+                if qtd:
+                    texto += f"    {faixa:>3}-{faixa + 9:<3} {qtd:>8}\n"
+
+            total_capturas = sum(c * n for c, n in self.capturas_por_partida.items())
+            texto += "\n  CAPTURAS:\n"
+            texto += f"    total {total_capturas}, média por partida {total_capturas / validas:.1f}\n"
+            texto += f"    pelas brancas {self.capturas_por_cor['b']}, pelas pretas {self.capturas_por_cor['p']}\n"
+            texto += f"    lances com captura múltipla {self.capturas_multiplas}\n"
+
+            texto += f"\n  ABERTURAS MAIS FREQUENTES ({self.lances_abertura} lances):\n"
+            for abertura, qtd in self.aberturas.most_common(limite):
+                texto += f"    {abertura:<24} {qtd:>8}\n"
+
+            texto += "\n  TAXA DE VITÓRIA POR PRIMEIRO LANCE (brancas / pretas / empate):\n"
+            taxas = sorted(self.taxas_por_primeiro_lance().items(), key=lambda t: -t[1][0])
+            for lance, (total, vb, vp, em) in taxas[:limite]:
+                texto += f"    {lance:<8} {total:>8}   {vb:.1%} / {vp:.1%} / {em:.1%}\n"
+
+        if self.exemplos_ilegais:
+            texto += "\n  EXEMPLOS DE REGISTROS ILEGAIS:\n"
+            for linha, erro in self.exemplos_ilegais:
+                texto += f"    {linha}\n      -> {erro}\n"
+        return texto
+
+
+def _lotes(linhas, tamanho):
+    """Agrupa um iterador de linhas em listas de até 'tamanho' elementos"""
+    linhas = iter(linhas)
+    while True:
+        lote = list(islice(linhas, tamanho))
+        if not lote:
+            return
+        yield lote
+
+
+def _analisar_lote(lote, lances_abertura=LANCES_ABERTURA):
+    """Processa um lote de partidas em um processo trabalhador"""
+    estatisticas = Estatisticas(lances_abertura)
+    for linha in lote:
+        estatisticas.registrar(linha)
+    return estatisticas
+
+
+def analisar(linhas, processos=None, tamanho_lote=TAMANHO_LOTE, lances_abertura=LANCES_ABERTURA):
+    """
+    Analisa um fluxo de partidas usando um conjunto de processos trabalhadores
+    linhas: iterável de linhas no formato compacto (ex.: ler_registros(caminho))
+    processos: número de processos (padrão: número de CPUs); 1 analisa no próprio processo
+    lances_abertura: quantidade de lances iniciais que identificam uma abertura
+    Retorna: Estatisticas agregadas
+    """
+    processos = processos or cpu_count()
+    total = Estatisticas(lances_abertura)
+
+    if processos == 1:
+        for lote in _lotes(linhas, tamanho_lote):
+            total.mesclar(_analisar_lote(lote, lances_abertura))
+        return total
+
+    # Mantém um número limitado de lotes em andamento para que a leitura
+    # do arquivo não avance além do que os trabalhadores conseguem processar
+    max_pendentes = processos * 2
+    with Pool(processos) as pool:
+        pendentes = deque()
+        for lote in _lotes(linhas, tamanho_lote):
+            pendentes.append(pool.apply_async(_analisar_lote, (lote, lances_abertura)))
+            if len(pendentes) >= max_pendentes:
+                total.mesclar(pendentes.popleft().get())
+        while pendentes:
+            total.mesclar(pendentes.popleft().get())
+    return total
+
+
+def main():
+    """Analisa o arquivo de partidas informado na linha de comando"""
+    if len(sys.argv) < 2:
+        print("Uso: python analisador.py <arquivo de partidas> [processos]")
+        return
+    processos = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    estatisticas = analisar(ler_registros(sys.argv[1]), processos)
+    print(estatisticas.relatorio())
+
+
+if __name__ == "__main__":
+    main()
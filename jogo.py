@@ -1,5 +1,7 @@
 class Jogador:
     """Representa um jogador do jogo de damas"""
+
+    __slots__ = ("_cor", "_nome", "_pecas")
     
     def __init__(self, cor, nome):
         """
@@ -11,7 +13,8 @@ class Jogador:
             raise ValueError("cor inválida: use 'b' (brancas) ou 'p' (pretas)")
         self._cor = cor
         self._nome = nome
-        self._pecas = []
+        # dict usado como conjunto ordenado: pertinência e remoção em O(1)
+        self._pecas = {}
 
     @property
     def nome(self):
@@ -23,21 +26,26 @@ class Jogador:
 
     @property
     def pecas(self):
-        return self._pecas
+        """Retorna uma cópia da lista de peças (alterações no jogador não a afetam)"""
+        return list(self._pecas)
+
+    def quantidade_pecas(self):
+        """Retorna o número de peças do jogador sem copiar a lista"""
+        return len(self._pecas)
 
     def adicionar_peca(self, peca):
         if not isinstance(peca, Peca):
             raise ValueError("Só é permitido adicionar objetos Peca")
-        if peca not in self._pecas:
-            self._pecas.append(peca)
+        self._pecas[peca] = None
 
     def remover_peca(self, peca):
-        if peca in self._pecas:
-            self._pecas.remove(peca)
+        self._pecas.pop(peca, None)
 
 
 class Peca:
     """Representa uma peça do jogo (pedra ou dama)"""
+
+    __slots__ = ("_tipo", "_cor", "_casa")
     
     def __init__(self, tipo, cor):
         """
@@ -59,6 +67,7 @@ class Peca:
         if valor not in ("p", "d"):
             raise ValueError("tipo inválido: use 'p' (pedra) ou 'd' (dama)")
         self._tipo = valor
+        self._invalidar_render()
 
     @property
     def cor(self):
@@ -69,6 +78,12 @@ class Peca:
         if valor not in ("b", "p"):
             raise ValueError("cor inválida: use 'b' (brancas) ou 'p' (pretas)")
         self._cor = valor
+        self._invalidar_render()
+
+    def _invalidar_render(self):
+        """Avisa o tabuleiro que o símbolo da peça mudou"""
+        if self._casa is not None and self._casa._tabuleiro is not None:
+            self._casa._tabuleiro.invalidar_linhas(self._casa._posicao[0])
 
     @property
     def casa(self):
@@ -94,11 +109,15 @@ class Peca:
 
 class Casa:
     """Representa uma casa do tabuleiro"""
+
+    __slots__ = ("_posicao", "_cor", "_conteudo", "_tabuleiro")
     
     def __init__(self, posicao):
         self._posicao = None
         self._cor = None
         self._conteudo = None
+        # Tabuleiro notificado quando o conteúdo muda (invalida o cache de renderização)
+        self._tabuleiro = None
         self.posicao = posicao
 
     @property
@@ -128,11 +147,17 @@ class Casa:
     def conteudo(self, valor):
         if valor is not None and not isinstance(valor, Peca):
             raise ValueError("conteudo deve ser uma Peca ou None")
+        self._colocar(valor)
+
+    def _colocar(self, peca):
+        """Atualiza o conteúdo sem validação (uso interno, peça já validada)"""
         if self._conteudo is not None:
             self._conteudo._casa = None
-        self._conteudo = valor
-        if valor is not None:
-            valor._casa = self
+        self._conteudo = peca
+        if peca is not None:
+            peca._casa = self
+        if self._tabuleiro is not None:
+            self._tabuleiro.invalidar_linhas(self._posicao[0])
 
     def __str__(self):
         if self._conteudo:
@@ -146,6 +171,9 @@ class Tabuleiro:
     def __init__(self, jogador_branco, jogador_preto):
         self.jogador_branco = jogador_branco
         self.jogador_preto = jogador_preto
+        # Cache de renderização: fragmentos por linha e texto completo de cada renderizador
+        self._fragmentos = {nome: [None] * 8 for nome in self._RENDERIZADORES}
+        self._renderizados = {}
         self._casas = self._criar_tabuleiro_inicial()
 
     @property
@@ -159,17 +187,18 @@ class Tabuleiro:
             linha = []
             for j in range(8):
                 casa = Casa((i, j))
+                casa._tabuleiro = self
                 # Coloca peças pretas nas 3 primeiras linhas (casas pretas)
                 if casa.cor == "p":
                     if i in (0, 1, 2):
                         peca = Peca("p", self.jogador_preto.cor)
                         self.jogador_preto.adicionar_peca(peca)
-                        casa.conteudo = peca
+                        casa._colocar(peca)
                     # Coloca peças brancas nas 3 últimas linhas (casas pretas)
                     elif i in (5, 6, 7):
                         peca = Peca("p", self.jogador_branco.cor)
                         self.jogador_branco.adicionar_peca(peca)
-                        casa.conteudo = peca
+                        casa._colocar(peca)
                 linha.append(casa)
             tabuleiro.append(linha)
         return tabuleiro
@@ -179,16 +208,85 @@ class Tabuleiro:
             return None
         return self._casas[linha][coluna]
 
+    _CABECALHO = "   0 1 2 3 4 5 6 7\n  -----------------\n"
+    _RODAPE = "  -----------------\n   0 1 2 3 4 5 6 7\n"
+
+    # nome: (método que gera uma linha, cabeçalho, separador entre linhas, rodapé)
+    _RENDERIZADORES = {
+        "texto": ("_linha_texto", _CABECALHO, "", _RODAPE),
+        "compacto": ("_linha_compacta", "", "/", ""),
+        "ansi": ("_linha_ansi", _CABECALHO, "", _RODAPE),
+    }
+
+    _ANSI_FUNDO = {"b": "\033[47m", "p": "\033[100m"}
+    _ANSI_PECA = {"b": "\033[1;97m", "p": "\033[1;31m"}
+    _ANSI_RESET = "\033[0m"
+
+    def invalidar_linhas(self, *linhas):
+        """
+        Descarta os fragmentos em cache das linhas alteradas
+        Chamado pelas casas do tabuleiro sempre que seu conteúdo muda
+        """
+        for fragmentos in self._fragmentos.values():
+            for linha in linhas:
+                fragmentos[linha] = None
+        self._renderizados.clear()
+
+    def _renderizar(self, nome):
+        """Monta a representação do renderizador 'nome', reaproveitando as linhas em cache"""
+        texto = self._renderizados.get(nome)
+        if texto is not None:
+            return texto
+        metodo, cabecalho, separador, rodape = self._RENDERIZADORES[nome]
+        gerar_linha = getattr(self, metodo)
+        fragmentos = self._fragmentos[nome]
+        for i in range(8):
+            if fragmentos[i] is None:
+                fragmentos[i] = gerar_linha(i)
+        texto = cabecalho + separador.join(fragmentos) + rodape
+        self._renderizados[nome] = texto
+        return texto
+
+    def _linha_texto(self, i):
+        return f"{i}| " + "".join(str(casa) + " " for casa in self._casas[i]) + f"|{i}\n"
+
+    def _linha_compacta(self, i):
+        fragmento = ""
+        vazias = 0
+        for casa in self._casas[i]:
+            if casa.conteudo:
+                if vazias:
+                    fragmento += str(vazias)
+                    vazias = 0
+                fragmento += casa.conteudo.simbolo
+            else:
+                vazias += 1
+        if vazias:
+            fragmento += str(vazias)
+        return fragmento
+
+    def _linha_ansi(self, i):
+        fragmento = f"{i}|"
+        for casa in self._casas[i]:
+            simbolo = casa.conteudo.simbolo if casa.conteudo else " "
+            cor_peca = self._ANSI_PECA[casa.conteudo.cor] if casa.conteudo else ""
+            fragmento += f"{self._ANSI_FUNDO[casa.cor]}{cor_peca}{simbolo} {self._ANSI_RESET}"
+        return fragmento + f"|{i}\n"
+
     def to_string(self):
         """Retorna representação visual do tabuleiro como string"""
-        board_str = "   0 1 2 3 4 5 6 7\n  -----------------\n"
-        for i, linha in enumerate(self._casas):
-            board_str += f"{i}| "
-            for casa in linha:
-                board_str += str(casa) + " "
-            board_str += f"|{i}\n"
-        board_str += "  -----------------\n   0 1 2 3 4 5 6 7\n"
-        return board_str
+        return self._renderizar("texto")
+
+    def to_compacto(self):
+        """
+        Retorna representação compacta no estilo FEN: linhas separadas por '/',
+        peças pelo símbolo (o, O, x, X) e casas vazias consecutivas por um dígito
+        """
+        return self._renderizar("compacto")
+
+    def to_ansi(self):
+        """Retorna representação visual colorida com códigos ANSI para terminais"""
+        return self._renderizar("ansi")
 
 
 class Damas:
@@ -289,7 +387,7 @@ class Damas:
         Retorna: jogador vencedor, "EMPATE" ou None (jogo continua)
         """
         # Vitória por captura de todas as peças
-        if not self._get_adversario().pecas:
+        if not self._get_adversario().quantidade_pecas():
             return self.jogador_atual
 
         jogador_atual_pode_mover = self._tem_movimentos_validos(self.jogador_atual)
@@ -393,22 +491,22 @@ class Damas:
             if peca_capturada:
                 casa_meio = peca_capturada.casa
                 if casa_meio:
-                    casa_meio.conteudo = None
+                    casa_meio._colocar(None)
                 adversario.remover_peca(peca_capturada)
 
             # Move a peça
             if atual_casa.conteudo is peca:
-                atual_casa.conteudo = None
+                atual_casa._colocar(None)
 
-            casa_final.conteudo = peca
+            casa_final._colocar(peca)
             atual_casa = casa_final
 
         # Promove a dama se atingiu a última linha
         if peca.tipo == 'p':
             l_fin_final = atual_casa.posicao[0]
             if (peca.cor == 'b' and l_fin_final == 0) or (peca.cor == 'p' and l_fin_final == 7):
-                peca.tipo = 'd'
-
+                peca._tipo = 'd'
+                self.tabuleiro.invalidar_linhas(l_fin_final)
         return None
 
     def _validar_movimento_pedra(self, peca, l_ini, c_ini, l_fin, c_fin):
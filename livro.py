@@ -0,0 +1,211 @@
+import hashlib
+import mmap
+import random
+import struct
+import sys
+
+from analisador import converter_lance, formatar_lance, ler_registros, reproduzir_partida
+from jogo import Damas, Jogador
+from motor import Motor, CacheAnalise, chave_do_jogo, gerar_lances, expandir, PROFUNDIDADE_PADRAO
+
+# Formato do arquivo do livro de aberturas:
+#   cabeçalho: MAGICO (8 bytes) + quantidade de registros (uint32, big-endian)
+#   registros de tamanho fixo, ordenados por hash da posição (busca binária direta no arquivo):
+#     hash da posição (uint64) | lance (12 bytes: uma casa por byte, linha * 8 + coluna,
+#     completado com 0xFF) | partidas | vitórias | empates (uint32 cada)
+# Vitórias e empates são contados do ponto de vista de quem joga na posição.
+
+MAGICO = b"DAMASLV1"
+CABECALHO = struct.Struct(">8sI")
+REGISTRO = struct.Struct(">Q12sIII")
+MAX_CASAS_LANCE = 12
+VAZIO = 0xFF
+
+LANCES_LIVRO = 16
+MINIMO_PARTIDAS = 3
+
+
+def hash_posicao(compacto, cor):
+    """Retorna o hash de 64 bits da posição (representação compacta + cor de quem joga)"""
+    return int.from_bytes(hashlib.blake2b(f"{compacto} {cor}".encode(), digest_size=8).digest(), "big")
+
+
+def _codificar_lance(posicoes):
+    casas = bytes(l * 8 + c for l, c in posicoes)
+    return casas + bytes([VAZIO]) * (MAX_CASAS_LANCE - len(casas))
+
+
+def _decodificar_lance(dados):
+    return [divmod(casa, 8) for casa in dados if casa != VAZIO]
+
+
+def construir_livro(linhas, caminho, lances_livro=LANCES_LIVRO):
+    """
+    Agrega as estatísticas dos primeiros lances de cada partida e grava o livro
+    Partidas ilegais ou não terminadas são ignoradas
+    linhas: iterável de partidas no formato compacto do analisador (ex.: ler_registros(caminho))
+    lances_livro: quantidade de lances iniciais de cada partida incluídos no livro
+    Retorna: (partidas usadas, registros gravados)
+    """
+    estatisticas = {}
+    usadas = 0
+    for linha in linhas:
+        lances = linha.split()
+        resultado, _, erro = reproduzir_partida(lances)
+        # Sem resultado a partida contaria como derrota para os dois lados
+        if erro or resultado is None:
+            continue
+        usadas += 1
+
+        jogo = Damas(Jogador('b', "Brancas"), Jogador('p', "Pretas"))
+        for lance in lances[:lances_livro]:
+            posicoes = converter_lance(lance)
+            if len(posicoes) > MAX_CASAS_LANCE:
+                break
+            compacto, cor = chave_do_jogo(jogo)
+            contagem = estatisticas.setdefault((hash_posicao(compacto, cor), _codificar_lance(posicoes)), [0, 0, 0])
+            contagem[0] += 1
+            if resultado == cor:
+                contagem[1] += 1
+            elif resultado == "EMPATE":
+                contagem[2] += 1
+            jogo.validar_e_mover(posicoes)
+            if jogo.verificar_vitoria():
+                break
+            jogo.trocar_turno()
+
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(CABECALHO.pack(MAGICO, len(estatisticas)))
+        for (chave, lance), (partidas, vitorias, empates) in sorted(estatisticas.items()):
+            arquivo.write(REGISTRO.pack(chave, lance, partidas, vitorias, empates))
+    return usadas, len(estatisticas)
+
+
+def partidas_autojogo(quantidade, profundidade=PROFUNDIDADE_PADRAO, lances_aleatorios=4, max_lances=200,
+                      lances_sem_progresso=40, max_tentativas=None, semente=None):
+    """
+    Gera partidas terminadas do motor contra si mesmo no formato compacto do analisador
+    lances_aleatorios: lances iniciais sorteados entre os legais, para variar as aberturas
+    lances_sem_progresso: abandona a partida após esse número de lances sem captura nem promoção
+    max_tentativas: limite de partidas iniciadas (padrão: 10 * quantidade)
+
+    Partidas abandonadas (sem progresso ou acima de max_lances) não têm resultado e seriam
+    descartadas por construir_livro, então não são geradas: o autojogo continua até obter
+    'quantidade' partidas terminadas ou esgotar max_tentativas.
+    """
+    sorteio = random.Random(semente)
+    cache = CacheAnalise()
+    motores = {cor: Motor(cor, profundidade, cache=cache) for cor in ("b", "p")}
+    max_tentativas = max_tentativas if max_tentativas is not None else 10 * quantidade
+    geradas = 0
+    for _ in range(max_tentativas):
+        if geradas >= quantidade:
+            return
+        jogo = Damas(Jogador('b', "Brancas"), Jogador('p', "Pretas"))
+        lances = []
+        terminada = False
+        sem_progresso = 0
+        while len(lances) < max_lances and sem_progresso < lances_sem_progresso:
+            compacto, cor = chave_do_jogo(jogo)
+            if len(lances) < lances_aleatorios:
+                legais = gerar_lances(expandir(compacto), cor)
+                posicoes = sorteio.choice(legais)[0] if legais else None
+            else:
+                posicoes = motores[cor].escolher_jogada(jogo)
+            if posicoes is None:
+                break
+            jogo.validar_e_mover(posicoes)
+            lances.append(formatar_lance(posicoes))
+            if jogo.verificar_vitoria():
+                terminada = True
+                break
+            # Captura reduz o número de peças; promoção aumenta o de damas
+            novo = jogo.tabuleiro.to_compacto()
+            if (sum(s.isalpha() for s in novo), sum(s.isupper() for s in novo)) != \
+                    (sum(s.isalpha() for s in compacto), sum(s.isupper() for s in compacto)):
+                sem_progresso = 0
+            else:
+                sem_progresso += 1
+            jogo.trocar_turno()
+        if terminada:
+            geradas += 1
+            yield " ".join(lances)
+
+
+class LivroAberturas:
+    """Consulta um livro de aberturas gravado por construir_livro, sem carregá-lo na memória"""
+
+    def __init__(self, caminho):
+        self._arquivo = open(caminho, "rb")
+        try:
+            self._dados = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._arquivo.close()
+            raise ValueError("arquivo não é um livro de aberturas válido")
+        if len(self._dados) < CABECALHO.size:
+            self.fechar()
+            raise ValueError("arquivo não é um livro de aberturas válido")
+        magico, self._quantidade = CABECALHO.unpack_from(self._dados, 0)
+        if magico != MAGICO or len(self._dados) != CABECALHO.size + self._quantidade * REGISTRO.size:
+            self.fechar()
+            raise ValueError("arquivo não é um livro de aberturas válido")
+
+    def __len__(self):
+        return self._quantidade
+
+    def _hash_do_registro(self, indice):
+        return struct.unpack_from(">Q", self._dados, CABECALHO.size + indice * REGISTRO.size)[0]
+
+    def consultar(self, compacto, cor):
+        """
+        Retorna os lances registrados para a posição
+        Retorna: lista de (posicoes, partidas, vitórias, empates)
+        """
+        chave = hash_posicao(compacto, cor)
+        inicio, fim = 0, self._quantidade
+        while inicio < fim:
+            meio = (inicio + fim) // 2
+            if self._hash_do_registro(meio) < chave:
+                inicio = meio + 1
+            else:
+                fim = meio
+        lances = []
+        while inicio < self._quantidade and self._hash_do_registro(inicio) == chave:
+            _, lance, partidas, vitorias, empates = REGISTRO.unpack_from(
+                self._dados, CABECALHO.size + inicio * REGISTRO.size)
+            lances.append((_decodificar_lance(lance), partidas, vitorias, empates))
+            inicio += 1
+        return lances
+
+    def melhor_lance(self, compacto, cor, minimo_partidas=MINIMO_PARTIDAS):
+        """Retorna o lance de melhor aproveitamento na posição, ou None se a posição não estiver no livro"""
+        candidatos = [((vitorias + empates / 2) / partidas, partidas, posicoes)
+                      for posicoes, partidas, vitorias, empates in self.consultar(compacto, cor)
+                      if partidas >= minimo_partidas]
+        if not candidatos:
+            return None
+        return max(candidatos, key=lambda c: (c[0], c[1]))[2]
+
+    def fechar(self):
+        self._dados.close()
+        self._arquivo.close()
+
+
+def main():
+    """Constrói um livro de aberturas a partir de arquivos de partidas ou de autojogo"""
+    if len(sys.argv) < 3:
+        print("Uso: python livro.py <livro de saída> <arquivo de partidas>...")
+        print("     python livro.py <livro de saída> --autojogo <quantidade> [profundidade]")
+        return
+    saida = sys.argv[1]
+    if sys.argv[2] == "--autojogo":
+        profundidade = int(sys.argv[4]) if len(sys.argv) > 4 else PROFUNDIDADE_PADRAO
+        linhas = partidas_autojogo(int(sys.argv[3]), profundidade)
+    else:
+        linhas = (linha for caminho in sys.argv[2:] for linha in ler_registros(caminho))
+    usadas, registros = construir_livro(linhas, saida)
+    print(f"Livro gravado em {saida}: {usadas} partidas, {registros} registros.")
+
+
+if __name__ == "__main__":
+    main()
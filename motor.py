@@ -0,0 +1,383 @@
+import threading
+from collections import OrderedDict
+
+# Representação interna do motor: lista de 64 símbolos (linha * 8 + coluna),
+# '.' para casa vazia e o/O/x/X para as peças, como em Peca.simbolo.
+# As posições são identificadas pela representação compacta de Tabuleiro.to_compacto
+# mais a cor de quem joga, o que permite compartilhar análises entre partidas.
+
+PROFUNDIDADE_PADRAO = 6
+TAMANHO_CACHE_PADRAO = 100000
+
+VITORIA = 100000
+VALOR_PEDRA = 100
+VALOR_DAMA = 300
+
+DIRECOES = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def _cor_da_peca(simbolo):
+    return "b" if simbolo in "oO" else "p"
+
+
+def _adversario(cor):
+    return "p" if cor == "b" else "b"
+
+
+def expandir(compacto):
+    """Converte a representação compacta do tabuleiro na lista de 64 casas do motor"""
+    casas = []
+    for simbolo in compacto.replace("/", ""):
+        if simbolo.isdigit():
+            casas.extend("." * int(simbolo))
+        else:
+            casas.append(simbolo)
+    return casas
+
+
+def compactar(casas):
+    """Converte a lista de 64 casas do motor para a representação compacta (inversa de expandir)"""
+    linhas = []
+    for i in range(0, 64, 8):
+        fragmento = ""
+        vazias = 0
+        for simbolo in casas[i:i + 8]:
+            if simbolo == ".":
+                vazias += 1
+                continue
+            if vazias:
+                fragmento += str(vazias)
+                vazias = 0
+            fragmento += simbolo
+        if vazias:
+            fragmento += str(vazias)
+        linhas.append(fragmento)
+    return "/".join(linhas)
+
+
+def chave_do_jogo(jogo):
+    """Retorna a chave (posição compacta, cor de quem joga) da posição atual de uma partida"""
+    return jogo.tabuleiro.to_compacto(), jogo.jogador_atual.cor
+
+
+def gerar_lances(casas, cor):
+    """
+    Gera todos os lances do jogador 'cor' aceitos por Damas.validar_e_mover
+    Retorna: lista de (posicoes, casas_resultantes)
+
+    Assim como validar_e_mover, cada etapa de uma captura múltipla é validada
+    contra o tabuleiro original: peças capturadas só saem ao final do lance.
+    """
+    lances = []
+    for origem, simbolo in enumerate(casas):
+        if simbolo == "." or _cor_da_peca(simbolo) != cor:
+            continue
+        l_ini, c_ini = divmod(origem, 8)
+        tipo = "d" if simbolo in "OX" else "p"
+        linha_promocao = 0 if cor == "b" else 7
+
+        def livre(l, c):
+            return casas[l * 8 + c] == "." or (l, c) == (l_ini, c_ini)
+
+        def finalizar(posicoes, capturadas):
+            resultado = casas[:]
+            resultado[origem] = "."
+            for idx in capturadas:
+                resultado[idx] = "."
+            l_fin, c_fin = posicoes[-1]
+            promovida = tipo == "d" or l_fin == linha_promocao
+            resultado[l_fin * 8 + c_fin] = (simbolo.upper() if promovida else simbolo)
+            lances.append((posicoes, resultado))
+
+        def etapas(l, c, tipo_atual):
+            """Gera (l_fin, c_fin, índice capturado ou None) a partir de (l, c)"""
+            if tipo_atual == "p":
+                direcao = -1 if cor == "b" else 1
+                for dc in (-1, 1):
+                    l1, c1 = l + direcao, c + dc
+                    if 0 <= l1 < 8 and 0 <= c1 < 8 and livre(l1, c1):
+                        yield l1, c1, None
+                    l2, c2 = l + 2 * direcao, c + 2 * dc
+                    if 0 <= l2 < 8 and 0 <= c2 < 8 and livre(l2, c2):
+                        meio = casas[l1 * 8 + c1]
+                        if meio != "." and _cor_da_peca(meio) != cor:
+                            yield l2, c2, l1 * 8 + c1
+                return
+            for dl, dc in DIRECOES:
+                capturada = None
+                for dist in range(1, 8):
+                    l1, c1 = l + dist * dl, c + dist * dc
+                    if not (0 <= l1 < 8 and 0 <= c1 < 8):
+                        break
+                    conteudo = casas[l1 * 8 + c1]
+                    if conteudo == ".":
+                        yield l1, c1, capturada
+                        continue
+                    # A própria peça continua na origem durante a validação
+                    if capturada is not None or _cor_da_peca(conteudo) == cor:
+                        break
+                    capturada = l1 * 8 + c1
+
+        def encadear(posicoes, l, c, tipo_atual, capturadas):
+            for l_fin, c_fin, capturada in etapas(l, c, tipo_atual):
+                if capturada is None or capturada in capturadas:
+                    continue
+                novas_posicoes = posicoes + [(l_fin, c_fin)]
+                novas_capturadas = capturadas + [capturada]
+                finalizar(novas_posicoes, novas_capturadas)
+                proximo_tipo = "d" if tipo_atual == "d" or l_fin == linha_promocao else "p"
+                encadear(novas_posicoes, l_fin, c_fin, proximo_tipo, novas_capturadas)
+
+        # Movimentos simples (sem captura) só são permitidos com uma única etapa
+        for l_fin, c_fin, capturada in etapas(l_ini, c_ini, tipo):
+            if capturada is None:
+                finalizar([(l_ini, c_ini), (l_fin, c_fin)], [])
+        encadear([(l_ini, c_ini)], l_ini, c_ini, tipo, [])
+
+    # Capturas maiores primeiro melhora os cortes da busca alfa-beta
+    lances.sort(key=lambda lance: -len(lance[0]))
+    return lances
+
+
+def pode_mover(casas, cor):
+    """Verifica, sem gerar os lances, se o jogador 'cor' tem algum lance (equivale a bool(gerar_lances))"""
+    for origem, simbolo in enumerate(casas):
+        if simbolo == "." or _cor_da_peca(simbolo) != cor:
+            continue
+        l, c = divmod(origem, 8)
+        if simbolo in "OX":
+            direcoes = DIRECOES
+        else:
+            direcao = -1 if cor == "b" else 1
+            direcoes = ((direcao, -1), (direcao, 1))
+        for dl, dc in direcoes:
+            l1, c1 = l + dl, c + dc
+            if not (0 <= l1 < 8 and 0 <= c1 < 8):
+                continue
+            vizinha = casas[l1 * 8 + c1]
+            if vizinha == ".":
+                return True
+            # Qualquer captura começa saltando uma peça adversária adjacente
+            l2, c2 = l1 + dl, c1 + dc
+            if _cor_da_peca(vizinha) != cor and 0 <= l2 < 8 and 0 <= c2 < 8 and casas[l2 * 8 + c2] == ".":
+                return True
+    return False
+
+
+def avaliar(casas, cor):
+    """Avalia a posição do ponto de vista de 'cor' (material e avanço das pedras)"""
+    valor = 0
+    for idx, simbolo in enumerate(casas):
+        if simbolo == ".":
+            continue
+        if simbolo == "o":
+            pontos = VALOR_PEDRA + (7 - idx // 8)
+        elif simbolo == "x":
+            pontos = VALOR_PEDRA + idx // 8
+        else:
+            pontos = VALOR_DAMA
+        valor += pontos if _cor_da_peca(simbolo) == cor else -pontos
+    return valor
+
+
+class BuscaInterrompida(Exception):
+    """Levantada quando uma busca é cancelada antes de terminar"""
+
+
+class CacheAnalise:
+    """
+    Cache LRU de análises concluídas, compartilhado entre partidas do mesmo processo
+    Chave: (posição compacta, cor de quem joga); valor: (profundidade, lance, avaliação)
+    """
+
+    def __init__(self, tamanho_maximo=TAMANHO_CACHE_PADRAO):
+        if tamanho_maximo < 1:
+            raise ValueError("tamanho_maximo deve ser positivo")
+        self._tamanho_maximo = tamanho_maximo
+        self._entradas = OrderedDict()
+        self._trava = threading.Lock()
+
+    @property
+    def tamanho_maximo(self):
+        return self._tamanho_maximo
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def obter(self, chave, profundidade):
+        """Retorna (lance, avaliação) se houver análise com profundidade suficiente, senão None"""
+        with self._trava:
+            entrada = self._entradas.get(chave)
+            if entrada is None or entrada[0] < profundidade:
+                return None
+            self._entradas.move_to_end(chave)
+            return entrada[1], entrada[2]
+
+    def guardar(self, chave, profundidade, lance, valor):
+        """Armazena uma análise, mantendo a mais profunda e descartando a menos usada se cheio"""
+        with self._trava:
+            entrada = self._entradas.get(chave)
+            if entrada is not None and entrada[0] > profundidade:
+                self._entradas.move_to_end(chave)
+                return
+            self._entradas[chave] = (profundidade, lance, valor)
+            self._entradas.move_to_end(chave)
+            if len(self._entradas) > self._tamanho_maximo:
+                self._entradas.popitem(last=False)
+
+    def limpar(self):
+        with self._trava:
+            self._entradas.clear()
+
+
+# Cache único do processo: partidas simultâneas reaproveitam as análises umas das outras
+cache_analise = CacheAnalise()
+
+
+class Motor:
+    """Jogador automático baseado em busca alfa-beta, com ponderação no turno do adversário"""
+
+    def __init__(self, cor, profundidade=PROFUNDIDADE_PADRAO, cache=None, livro=None):
+        """
+        cor: 'b' para brancas ou 'p' para pretas
+        profundidade: número de lances analisados à frente
+        cache: CacheAnalise usado (padrão: cache compartilhado do processo)
+        livro: LivroAberturas consultado antes da busca (opcional)
+        """
+        if cor not in ("b", "p"):
+            raise ValueError("cor inválida: use 'b' (brancas) ou 'p' (pretas)")
+        if profundidade < 1:
+            raise ValueError("profundidade deve ser pelo menos 1")
+        self._cor = cor
+        self._profundidade = profundidade
+        self._cache = cache if cache is not None else cache_analise
+        self._livro = livro
+        self._ponderacao = None
+        self._chave_ponderada = None
+        self._parar = threading.Event()
+
+    @property
+    def cor(self):
+        return self._cor
+
+    @property
+    def profundidade(self):
+        return self._profundidade
+
+    def lance_do_livro(self, compacto, cor):
+        """Retorna o lance do livro de aberturas para a posição, se houver e for legal"""
+        if self._livro is None:
+            return None
+        lance = self._livro.melhor_lance(compacto, cor)
+        if lance is None:
+            return None
+        # Protege contra colisões de hash ou livro corrompido
+        if any(posicoes == lance for posicoes, _ in gerar_lances(expandir(compacto), cor)):
+            return lance
+        return None
+
+    def analisar(self, compacto, cor, parar=None):
+        """
+        Busca o melhor lance de 'cor' na posição compacta informada
+        Retorna: (posicoes, avaliação) ou (None, avaliação) se não houver lances
+        """
+        chave = (compacto, cor)
+        resultado = self._cache.obter(chave, self._profundidade)
+        if resultado is not None:
+            return resultado
+        lance, valor = self._raiz(expandir(compacto), cor, parar)
+        self._cache.guardar(chave, self._profundidade, lance, valor)
+        return lance, valor
+
+    def _raiz(self, casas, cor, parar):
+        melhor_lance, alfa = None, -VITORIA - 1
+        for posicoes, resultado in gerar_lances(casas, cor):
+            valor = -self._negamax(resultado, _adversario(cor), self._profundidade - 1, -VITORIA - 1, -alfa, 1, parar)
+            if melhor_lance is None or valor > alfa:
+                melhor_lance, alfa = posicoes, valor
+        if melhor_lance is None:
+            return None, -VITORIA
+        return melhor_lance, alfa
+
+    def _negamax(self, casas, cor, profundidade, alfa, beta, distancia, parar):
+        if parar is not None and parar.is_set():
+            raise BuscaInterrompida()
+        # Fim de jogo verificado na mesma ordem de Damas.verificar_vitoria,
+        # do ponto de vista de quem acabou de jogar (o adversário de 'cor')
+        if not any(s != "." and _cor_da_peca(s) == cor for s in casas):
+            return -VITORIA + distancia
+        pode = pode_mover(casas, cor)
+        adversario_pode = pode_mover(casas, _adversario(cor))
+        if not pode and not adversario_pode:
+            return 0
+        if not adversario_pode:
+            return VITORIA - distancia
+        if not pode:
+            return -VITORIA + distancia
+        if profundidade == 0:
+            return avaliar(casas, cor)
+        for _, resultado in gerar_lances(casas, cor):
+            valor = -self._negamax(resultado, _adversario(cor), profundidade - 1, -beta, -alfa, distancia + 1, parar)
+            if valor >= beta:
+                return valor
+            alfa = max(alfa, valor)
+        return alfa
+
+    def escolher_jogada(self, jogo):
+        """
+        Escolhe a jogada do motor na posição atual da partida
+        Retorna: lista de posições no formato de validar_e_mover, ou None se não houver lances
+        """
+        chave = chave_do_jogo(jogo)
+        lance = self.lance_do_livro(*chave)
+        if lance is not None:
+            self.parar_ponderacao()
+            return lance
+        if self._ponderacao is not None and self._chave_ponderada == chave:
+            # O adversário jogou o lance previsto: aproveita a busca já em andamento
+            self._ponderacao.join()
+            self._ponderacao = None
+        else:
+            self.parar_ponderacao()
+        lance, _ = self.analisar(*chave)
+        return lance
+
+    def ponderar(self, jogo):
+        """
+        Inicia, em segundo plano, a análise da resposta ao lance previsto do adversário
+        Deve ser chamado no início do turno do adversário
+        """
+        self.parar_ponderacao()
+        compacto, cor = chave_do_jogo(jogo)
+        if cor == self._cor:
+            return
+        self._parar.clear()
+        self._ponderacao = threading.Thread(target=self._ponderar, args=(compacto, cor), daemon=True)
+        self._ponderacao.start()
+
+    def _ponderar(self, compacto, cor_adversario):
+        try:
+            previsto = self.lance_do_livro(compacto, cor_adversario)
+            if previsto is None:
+                previsto, _ = self.analisar(compacto, cor_adversario, self._parar)
+            if previsto is None:
+                return
+            casas = expandir(compacto)
+            for posicoes, resultado in gerar_lances(casas, cor_adversario):
+                if posicoes == previsto:
+                    chave = (compactar(resultado), self._cor)
+                    self._chave_ponderada = chave
+                    # Posição de livro não precisa de busca
+                    if self.lance_do_livro(*chave) is None:
+                        self.analisar(*chave, self._parar)
+                    break
+        except BuscaInterrompida:
+            pass
+
+    def parar_ponderacao(self):
+        """Cancela a ponderação em andamento, se houver"""
+        if self._ponderacao is not None:
+            self._parar.set()
+            self._ponderacao.join()
+            self._ponderacao = None
+        self._chave_ponderada = None
@@ -1,6 +1,8 @@
 import socket
 import json
+import sys
 from jogo import Damas, Jogador
+from motor import Motor, PROFUNDIDADE_PADRAO
 
 def enviar_mensagem(sock, tipo, dados):
     """Envia mensagem JSON com prefixo de tamanho (2 bytes)"""
@@ -40,8 +42,44 @@ def receber_mensagem(sock):
         return None
 
 def main():
-    """Função principal do servidor - gerencia conexão e loop do jogo"""
+    """
+    Função principal do servidor - gerencia conexão e loop do jogo
+    Uso: python servidor.py [--motor [profundidade]] [--livro arquivo]
+      --motor: as pretas são jogadas pelo motor, que pondera durante o turno do cliente
+      --livro: livro de aberturas consultado pelo motor antes de buscar
+    """
     endereco = ('127.0.0.1', 50000)
+
+    uso = "Uso: python servidor.py [--motor [profundidade]] [--livro arquivo]"
+    profundidade = PROFUNDIDADE_PADRAO
+    if "--motor" in sys.argv:
+        idx = sys.argv.index("--motor")
+        if len(sys.argv) > idx + 1 and not sys.argv[idx + 1].startswith("--"):
+            if not sys.argv[idx + 1].isdigit() or int(sys.argv[idx + 1]) < 1:
+                print(uso)
+                print("  A profundidade do motor deve ser um inteiro maior ou igual a 1.")
+                return
+            profundidade = int(sys.argv[idx + 1])
+
+    livro = None
+    if "--livro" in sys.argv:
+        idx = sys.argv.index("--livro")
+        if "--motor" not in sys.argv or len(sys.argv) <= idx + 1 or sys.argv[idx + 1].startswith("--"):
+            print(uso)
+            print("  --livro exige --motor e o caminho do arquivo do livro.")
+            return
+        # Importado só quando usado: livro depende do analisador (multiprocessing)
+        from livro import LivroAberturas
+        try:
+            livro = LivroAberturas(sys.argv[idx + 1])
+        except (OSError, ValueError) as erro:
+            print(uso)
+            print(f"  Não foi possível abrir o livro: {erro}")
+            return
+
+    motor = None
+    if "--motor" in sys.argv:
+        motor = Motor('p', profundidade, livro=livro)
     
     # Cria e configura socket servidor
     socket_conexao = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -117,8 +155,19 @@ def main():
                 "info": "Turno do Jogador Servidor. Aguardando jogada..."
             })
 
-            # Loop de validação de jogada
+            # Jogada do motor
             jogada_valida = False
+            if motor:
+                posicoes = motor.escolher_jogada(jogo)
+                if posicoes:
+                    print("Motor joga: " + " ".join(f"{l},{c}" for l, c in posicoes))
+                    erro = jogo.validar_e_mover(posicoes)
+                    if erro:
+                        print(f"ERRO do motor: {erro}")
+                    else:
+                        jogada_valida = True
+
+            # Loop de validação de jogada
             while not jogada_valida:
                 try:
                     jogada = input("Digite sua jogada: ")
@@ -139,6 +188,10 @@ def main():
         # Turno do cliente (jogador remoto)
         else:
             print("Turno do Jogador Cliente. Aguardando jogada...")
+
+            # Motor analisa a resposta ao lance previsto enquanto o cliente pensa
+            if motor:
+                motor.ponderar(jogo)
             
             # Envia estado do jogo e solicita jogada
             enviar_mensagem(sock_dados, "estado_jogo", {
@@ -174,6 +227,11 @@ def main():
         if not vencedor:
             jogo.trocar_turno()
 
+    if motor:
+        motor.parar_ponderacao()
+    if livro is not None:
+        livro.fechar()
+
     # Exibe resultado final e notifica cliente
     board_final = jogo.tabuleiro.to_string()
     if vencedor == "EMPATE":
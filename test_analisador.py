@@ -0,0 +1,84 @@
+from analisador import Estatisticas, analisar, converter_lance, formatar_lance, reproduzir_partida
+
+# Brancas e pretas trocam uma peça cada: "4325" e "1634" são capturas simples
+PARTIDA_COM_CAPTURAS = "5243 2534 4325 1634"
+# Partida completa (vitória das pretas) gerada por autojogo
+PARTIDA_TERMINADA = (
+    "5647 2334 6556 1223 4736 254765 7456 0112 5041 1425 4130 0314 5241 2132 3021 12305274 5443 3254 "
+    "5645 3456 6745 1021 4534 2345 6150 1423 5041 7430 7061 0514 6150 2132 5041 3250 7261 5072 7665 5476"
+)
+
+
+def test_converter_lance():
+    assert converter_lance("5243") == [(5, 2), (4, 3)]
+    assert converter_lance("52341605") == [(5, 2), (3, 4), (1, 6), (0, 5)]
+    assert converter_lance("524") is None
+    assert converter_lance("52") is None
+    assert converter_lance("52a3") is None
+    assert converter_lance("5,43") is None
+    assert formatar_lance([(5, 2), (4, 3)]) == "5243"
+
+
+def test_reproduzir_partida_conta_capturas_por_lance():
+    resultado, capturas, erro = reproduzir_partida(PARTIDA_COM_CAPTURAS.split())
+    assert (resultado, capturas, erro) == (None, [0, 0, 1, 1], None)
+
+
+def test_reproduzir_partida_detecta_lance_ilegal():
+    resultado, capturas, erro = reproduzir_partida("5243 2132 4352".split())
+    assert resultado is None
+    assert capturas == [0, 0]
+    assert erro.startswith("Lance 3 (4352)")
+
+    _, _, erro = reproduzir_partida("5243 21x2".split())
+    assert "mal formatado" in erro
+
+
+def test_reproduzir_partida_detecta_lance_apos_fim():
+    resultado, capturas, erro = reproduzir_partida(PARTIDA_TERMINADA.split())
+    assert (resultado, erro) == ("p", None)
+    assert len(capturas) == 38 and sum(capturas) == 14
+
+    resultado, _, erro = reproduzir_partida(PARTIDA_TERMINADA.split() + ["5041"])
+    assert resultado == "p"
+    assert erro == "Lance 39 (5041) após o fim da partida."
+
+
+def _linhas():
+    return [PARTIDA_COM_CAPTURAS, "5243 2132", "5243 9999", PARTIDA_COM_CAPTURAS, "5647 2534"] * 7
+
+
+def _totais(estatisticas):
+    return (estatisticas.partidas, estatisticas.ilegais, estatisticas.aberturas, estatisticas.duracoes,
+            estatisticas.resultados, estatisticas.capturas_por_partida, estatisticas.capturas_por_cor,
+            estatisticas.capturas_multiplas, estatisticas.resultados_por_primeiro_lance)
+
+
+def test_mesclar_equivale_a_passagem_unica():
+    linhas = _linhas()
+    unica = Estatisticas()
+    for linha in linhas:
+        unica.registrar(linha)
+
+    partes = [Estatisticas(), Estatisticas(), Estatisticas()]
+    for idx, linha in enumerate(linhas):
+        partes[idx % 3].registrar(linha)
+    mesclada = Estatisticas()
+    for parte in partes:
+        mesclada.mesclar(parte)
+
+    assert _totais(mesclada) == _totais(unica)
+    assert unica.partidas == 35 and unica.ilegais == 7
+    assert unica.capturas_por_cor == {"b": 14, "p": 14}
+
+
+def test_analisar_em_paralelo_igual_a_sequencial():
+    sequencial = analisar(iter(_linhas()), processos=1, tamanho_lote=4)
+    paralelo = analisar(iter(_linhas()), processos=2, tamanho_lote=4)
+    assert _totais(paralelo) == _totais(sequencial)
+
+
+def test_relatorio_usa_lances_de_abertura_configurados():
+    estatisticas = analisar(iter(_linhas()), processos=1, lances_abertura=2)
+    assert "5243 2534" in estatisticas.aberturas
+    assert "ABERTURAS MAIS FREQUENTES (2 lances)" in estatisticas.relatorio()
@@ -0,0 +1,65 @@
+from jogo import Damas, Jogador, Peca
+
+
+def novo_jogo():
+    return Damas(Jogador('b', "Brancas"), Jogador('p', "Pretas"))
+
+
+def test_render_reflete_alteracao_fora_de_validar_e_mover():
+    jogo = novo_jogo()
+    tabuleiro = jogo.tabuleiro
+    tabuleiro.to_string(), tabuleiro.to_compacto()
+    ansi_antes = tabuleiro.to_ansi()
+
+    tabuleiro.get_casa(5, 0).conteudo = None
+
+    assert tabuleiro.to_string().splitlines()[7] == "5| - # o # o # o # |5"
+    assert tabuleiro.to_compacto().split("/")[5] == "2o1o1o1"
+    assert tabuleiro.to_ansi() != ansi_antes
+
+
+def test_render_reflete_peca_colocada_e_promovida():
+    jogo = novo_jogo()
+    tabuleiro = jogo.tabuleiro
+    tabuleiro.to_compacto()
+
+    casa = tabuleiro.get_casa(4, 1)
+    casa.conteudo = Peca("p", "b")
+    assert tabuleiro.to_compacto().split("/")[4] == "1o6"
+
+    casa.conteudo.tipo = "d"
+    assert tabuleiro.to_compacto().split("/")[4] == "1O6"
+    assert tabuleiro.to_string().splitlines()[6] == "4| # O # - # - # - |4"
+
+
+def test_render_reflete_troca_de_cor():
+    jogo = novo_jogo()
+    tabuleiro = jogo.tabuleiro
+    tabuleiro.to_compacto()
+
+    tabuleiro.get_casa(5, 0).conteudo.cor = "p"
+
+    assert tabuleiro.to_compacto().split("/")[5] == "x1o1o1o1"
+    assert tabuleiro.to_string().splitlines()[7] == "5| x # o # o # o # |5"
+
+
+def test_render_apos_jogada():
+    jogo = novo_jogo()
+    antes = jogo.tabuleiro.to_string()
+    assert jogo.validar_e_mover([(5, 2), (4, 3)]) is None
+    depois = jogo.tabuleiro.to_string()
+    assert antes != depois
+    assert jogo.tabuleiro.to_compacto() == "1x1x1x1x/x1x1x1x1/1x1x1x1x/8/3o4/o3o1o1/1o1o1o1o/o1o1o1o1"
+
+
+def test_pecas_retorna_lista_independente():
+    jogador = novo_jogo().jogador_atual
+    pecas = jogador.pecas
+    assert isinstance(pecas, list)
+    assert len(pecas) == 12
+    primeira = pecas[0]
+    for peca in jogador.pecas:
+        jogador.remover_peca(peca)
+    assert jogador.pecas == []
+    assert jogador.quantidade_pecas() == 0
+    assert len(pecas) == 12 and pecas[0] is primeira
@@ -0,0 +1,46 @@
+from analisador import converter_lance, reproduzir_partida
+from livro import LivroAberturas, construir_livro, partidas_autojogo
+
+INICIAL = "1x1x1x1x/x1x1x1x1/1x1x1x1x/8/8/o1o1o1o1/1o1o1o1o/o1o1o1o1"
+
+
+def test_partidas_nao_terminadas_sao_ignoradas(tmp_path):
+    caminho = str(tmp_path / "livro.bin")
+    # Partidas válidas, porém não terminadas
+    usadas, registros = construir_livro(["5243 2534", "5243 2132"], caminho)
+    assert (usadas, registros) == (0, 0)
+
+    livro = LivroAberturas(caminho)
+    assert len(livro) == 0
+    assert livro.consultar(INICIAL, "b") == []
+    livro.fechar()
+
+
+def test_livro_conta_apenas_partidas_terminadas(tmp_path):
+    caminho = str(tmp_path / "livro.bin")
+    terminada = next(partidas_autojogo(1, profundidade=1, semente=0))
+    resultado, _, erro = reproduzir_partida(terminada.split())
+    assert erro is None and resultado is not None
+    primeiro = converter_lance(terminada.split()[0])
+    # Mesmo primeiro lance, mas a partida para antes do fim
+    nao_terminada = terminada.split()[0]
+
+    usadas, _ = construir_livro([terminada, nao_terminada, nao_terminada], caminho)
+    assert usadas == 1
+
+    livro = LivroAberturas(caminho)
+    vitorias = 1 if resultado == "b" else 0
+    empates = 1 if resultado == "EMPATE" else 0
+    assert livro.consultar(INICIAL, "b") == [(primeiro, 1, vitorias, empates)]
+    livro.fechar()
+
+
+def test_autojogo_gera_apenas_partidas_terminadas():
+    partidas = list(partidas_autojogo(5, profundidade=2, semente=1))
+    assert len(partidas) == 5
+    for partida in partidas:
+        resultado, _, erro = reproduzir_partida(partida.split())
+        assert erro is None and resultado is not None
+
+    # Tentativas esgotadas: devolve só as partidas que terminaram
+    assert len(list(partidas_autojogo(5, profundidade=2, semente=1, max_tentativas=1))) <= 1
@@ -0,0 +1,132 @@
+import copy
+import random
+
+from jogo import Damas, Jogador, Peca
+from motor import CacheAnalise, Motor, chave_do_jogo, compactar, expandir, gerar_lances
+
+
+def novo_jogo():
+    return Damas(Jogador('b', "Brancas"), Jogador('p', "Pretas"))
+
+
+def jogo_da_posicao(compacto, cor):
+    """Cria uma partida com as peças da posição compacta e 'cor' na vez"""
+    jogo = novo_jogo()
+    jogadores = {"b": jogo.jogador_atual}
+    jogo.trocar_turno()
+    jogadores["p"] = jogo.jogador_atual
+    for linha in jogo.tabuleiro.casas:
+        for casa in linha:
+            if casa.conteudo:
+                jogadores[casa.conteudo.cor].remover_peca(casa.conteudo)
+                casa.conteudo = None
+    for idx, simbolo in enumerate(expandir(compacto)):
+        if simbolo == ".":
+            continue
+        peca = Peca("d" if simbolo in "OX" else "p", "b" if simbolo in "oO" else "p")
+        jogadores[peca.cor].adicionar_peca(peca)
+        jogo.tabuleiro.get_casa(*divmod(idx, 8)).conteudo = peca
+    if cor == "b":
+        jogo.trocar_turno()
+    return jogo
+
+
+def test_gerar_lances_coincide_com_validar_e_mover():
+    for semente in range(2):
+        sorteio = random.Random(semente)
+        jogo = novo_jogo()
+        for _ in range(50):
+            compacto, cor = chave_do_jogo(jogo)
+            lances = gerar_lances(expandir(compacto), cor)
+
+            # Todo lance gerado é aceito e produz o tabuleiro previsto
+            for posicoes, resultado in lances:
+                copia = copy.deepcopy(jogo)
+                assert copia.validar_e_mover(posicoes) is None, (compacto, posicoes)
+                assert copia.tabuleiro.to_compacto() == compactar(resultado)
+
+            # Todo movimento de uma etapa aceito por validar_e_mover é gerado;
+            # lances rejeitados não alteram a partida, então a cópia só é refeita após um aceito
+            simples = {tuple(posicoes) for posicoes, _ in lances if len(posicoes) == 2}
+            copia = copy.deepcopy(jogo)
+            for peca in jogo.jogador_atual.pecas:
+                l, c = peca.casa.posicao
+                for dist in range(1, 8):
+                    for dl in (-dist, dist):
+                        for dc in (-dist, dist):
+                            if 0 <= l + dl < 8 and 0 <= c + dc < 8:
+                                posicoes = [(l, c), (l + dl, c + dc)]
+                                if copia.validar_e_mover(posicoes) is None:
+                                    assert tuple(posicoes) in simples, (compacto, posicoes)
+                                    copia = copy.deepcopy(jogo)
+
+            if not lances:
+                break
+            jogo.validar_e_mover(sorteio.choice(lances)[0])
+            if jogo.verificar_vitoria():
+                break
+            jogo.trocar_turno()
+
+
+def test_motor_evita_ficar_sem_lances_apos_jogar():
+    # Depois de 41-30 as brancas ficam bloqueadas e perdem por verificar_vitoria
+    for profundidade in (1, 2, 3):
+        jogo = jogo_da_posicao("8/2x5/1x6/8/1o6/8/8/8", "b")
+        motor = Motor("b", profundidade, cache=CacheAnalise())
+        lance = motor.escolher_jogada(jogo)
+        assert lance != [(4, 1), (3, 0)]
+        assert jogo.validar_e_mover(lance) is None
+        assert jogo.verificar_vitoria() is None
+
+
+def test_cache_analise_descarta_menos_usada():
+    cache = CacheAnalise(tamanho_maximo=2)
+    cache.guardar("a", 3, [(0, 0)], 1)
+    cache.guardar("b", 3, [(0, 1)], 2)
+    assert cache.obter("a", 3) == ([(0, 0)], 1)
+    cache.guardar("c", 3, [(0, 2)], 3)
+    assert len(cache) == 2
+    assert cache.obter("b", 3) is None
+    assert cache.obter("a", 4) is None
+    assert cache.obter("c", 1) == ([(0, 2)], 3)
+
+
+def test_ponderacao_aproveitada_quando_lance_previsto_e_jogado():
+    jogo = novo_jogo()
+    motor = Motor("p", 3, cache=CacheAnalise())
+    motor.ponderar(jogo)
+    motor._ponderacao.join()
+
+    previsto, _ = motor.analisar(*chave_do_jogo(jogo))
+    assert jogo.validar_e_mover(previsto) is None
+    jogo.trocar_turno()
+    assert motor._chave_ponderada == chave_do_jogo(jogo)
+
+    buscas = []
+    raiz = motor._raiz
+    motor._raiz = lambda *args: buscas.append(args) or raiz(*args)
+    lance = motor.escolher_jogada(jogo)
+
+    assert buscas == []
+    assert lance is not None and jogo.validar_e_mover(lance) is None
+    assert motor._ponderacao is None
+
+
+def test_ponderacao_cancelada_quando_outro_lance_e_jogado():
+    jogo = novo_jogo()
+    motor = Motor("p", 3, cache=CacheAnalise())
+    motor.ponderar(jogo)
+    motor._ponderacao.join()
+
+    previsto, _ = motor.analisar(*chave_do_jogo(jogo))
+    compacto, cor = chave_do_jogo(jogo)
+    outro = next(posicoes for posicoes, _ in gerar_lances(expandir(compacto), cor) if posicoes != previsto)
+    assert jogo.validar_e_mover(outro) is None
+    jogo.trocar_turno()
+    assert motor._chave_ponderada != chave_do_jogo(jogo)
+
+    lance = motor.escolher_jogada(jogo)
+
+    assert motor._parar.is_set()
+    assert motor._ponderacao is None
+    assert lance is not None and jogo.validar_e_mover(lance) is None